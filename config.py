@@ -17,10 +17,16 @@ class Config:
         'BetternshipQuotesScraper/1.0 (+https://quotes.toscrape.com)'
     )
 
+    # Parsing Settings
+    HTML_PARSER: str = os.getenv('HTML_PARSER', 'lxml')
+
     # Output Settings
     OUTPUT_CSV: str = os.getenv('OUTPUT_CSV', 'quotes.csv')
     OUTPUT_JSON: str = os.getenv('OUTPUT_JSON', 'quotes.json')
 
+    # Cache Settings (empty path disables the on-disk author cache)
+    AUTHOR_CACHE_PATH: str = os.getenv('AUTHOR_CACHE_PATH', 'authors.json')
+
     @classmethod
     def validate(cls):
         """Validate critical configuration values"""
@@ -31,4 +37,7 @@ class Config:
             raise ValueError("REQUEST_TIMEOUT_SECONDS must be positive")
 
         if cls.RATE_LIMIT_DELAY_SECONDS < 0:
-            raise ValueError("RATE_LIMIT_DELAY_SECONDS cannot be negative")
\ No newline at end of file
+            raise ValueError("RATE_LIMIT_DELAY_SECONDS cannot be negative")
+
+        if cls.HTML_PARSER not in ('lxml', 'html.parser'):
+            raise ValueError("HTML_PARSER must be 'lxml' or 'html.parser'")
\ No newline at end of file
@@ -2,18 +2,143 @@ import asyncio
 import csv
 import json
 import logging
+import os
+import random
+import re
+import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass
+from html import unescape
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 import aiohttp
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import urljoin, urlsplit
 
 from config import Config
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional speedup; fall back to the default asyncio loop
+    uvloop = None
+
 
 logger = logging.getLogger(__name__)
 
+# Transient failures worth retrying; anything else is returned as None immediately.
+RETRYABLE_EXCEPTIONS = (
+    asyncio.TimeoutError,
+    aiohttp.ServerDisconnectedError,
+    aiohttp.ClientConnectorError,
+    aiohttp.ClientOSError,  # e.g. "connection reset by peer" on a pooled keep-alive socket
+    aiohttp.ClientPayloadError,
+)
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_DELAY_SECONDS = 8
+
+AUTHOR_INFO_KEYS = frozenset({"author_full_name", "author_born_date", "author_born_location"})
+
+CSV_FIELDNAMES = (
+    "quote_text",
+    "author_name",
+    "tags",
+    "author_full_name",
+    "author_born_date",
+    "author_born_location",
+)
+
+# CSS selectors are compiled once at import instead of on every select() call.
+SEL_QUOTE = sv.compile("div.quote")
+# Every field of a quote block in one selector, so each block is walked once.
+SEL_QUOTE_FIELDS = sv.compile("span.text, small.author, div.tags a.tag, span a[href^='/author/']")
+SEL_NEXT = sv.compile("li.next a")
+SEL_TITLE = sv.compile("h3.author-title")
+SEL_BORN_DATE = sv.compile("span.author-born-date")
+SEL_BORN_LOC = sv.compile("span.author-born-location")
+
+# Author profile fields, matched directly against the raw page HTML.
+_RE_AUTHOR_TITLE = re.compile(r'<h3 class="author-title">([^<]*)</h3>')
+_RE_BORN_DATE = re.compile(r'<span class="author-born-date">([^<]*)</span>')
+_RE_BORN_LOC = re.compile(r'<span class="author-born-location">([^<]*)</span>')
+
+# Quote page fields, matched directly against the raw page HTML one block at a time.
+_RE_QUOTE_START = re.compile(r'<div class="quote"[\s>]')
+# Any class attribute carrying a "quote" class token, however it is written.
+_RE_QUOTE_CLASS = re.compile(r"""class=["'](?:[^"']*\s)?quote(?:\s[^"']*)?["']""")
+_RE_QUOTE_TEXT = re.compile(r'<span class="text"[^>]*>([^<]*)</span>')
+_RE_QUOTE_AUTHOR = re.compile(r'<small class="author"[^>]*>([^<]*)</small>')
+_RE_QUOTE_AUTHOR_HREF = re.compile(r'<a href="(/author/[^"]*)"')
+_RE_QUOTE_TAGS = re.compile(r'<div class="tags">(.*?)</div>', re.S)
+_RE_QUOTE_TAG = re.compile(r'<a class="tag"[^>]*>([^<]*)</a>')
+_RE_NEXT_HREF = re.compile(r'<li class="next">\s*<a href="([^"]*)"')
+
+# When the regexes miss, quote pages are parsed with only their quote blocks
+# and the pager built into the tree.
+def _has_page_class(value: Any) -> bool:
+    # The strainer sees the raw attribute ("quote featured"), so match each
+    # class value separately, as the CSS selectors do.
+    if not value:
+        return False
+    classes = value.split() if isinstance(value, str) else value
+    return "quote" in classes or "next" in classes
+
+
+PAGE_STRAINER = SoupStrainer(["div", "li"], attrs={"class": _has_page_class})
+
+# Quote text, author name, tags and author href, as extracted from one block.
+RawQuote = Tuple[str, str, List[str], Optional[str]]
+
+
+@dataclass(slots=True)
+class Quote:
+    """A scraped quote joined with its author's profile details."""
+
+    quote_text: str
+    author_name: str
+    tags: List[str]
+    author_full_name: Optional[str] = None
+    author_born_date: Optional[str] = None
+    author_born_location: Optional[str] = None
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter shared by every request of a scraper.
+
+    Up to `capacity` requests may start immediately; after that, tokens refill
+    at `rate` per second, so only sustained traffic is throttled. A `rate` of
+    zero or less disables throttling.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = float(max(capacity, 1))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self._rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
 
 class QuoteScraper:
     """
@@ -35,23 +160,113 @@ class QuoteScraper:
         self._headers = {
             "User-Agent": Config.USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            # aiohttp decompresses transparently; HTML shrinks roughly 3-5x.
+            "Accept-Encoding": "gzip, deflate",
         }
 
-        self._semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_REQUESTS)
-        self._author_cache: Dict[str, Dict[str, Optional[str]]] = {}
-        self._author_cache_lock = asyncio.Lock()
-        self._author_inflight: Dict[str, asyncio.Task[Dict[str, Optional[str]]]] = {}
+        # Each of the MAX_CONCURRENT_REQUESTS slots may issue one request per
+        # RATE_LIMIT_DELAY_SECONDS; bursts up to the slot count go out at once.
+        self._rate = TokenBucket(
+            rate=(
+                Config.MAX_CONCURRENT_REQUESTS / Config.RATE_LIMIT_DELAY_SECONDS
+                if Config.RATE_LIMIT_DELAY_SECONDS > 0
+                else 0.0
+            ),
+            capacity=Config.MAX_CONCURRENT_REQUESTS,
+        )
+        # Parsing runs in worker threads; bound it so the default executor is not starved.
+        self._parse_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        # One future per author URL: the first caller resolves it, everyone else
+        # awaits it. Only touched from the event loop, so no lock is needed.
+        self._author_cache: Dict[str, asyncio.Future[Dict[str, Optional[str]]]] = {}
+
+        # Site links ("/author/...", "/page/N/") are root-relative, so resolve
+        # them by prefixing the origin instead of a full urljoin per link.
+        base_parts = urlsplit(Config.BASE_URL)
+        self._origin = f"{base_parts.scheme}://{base_parts.netloc}"
 
         self._session: Optional[aiohttp.ClientSession] = None
+        # Requests started ahead of time, keyed by URL; consumed by get_soup.
+        self._prefetched: Dict[str, asyncio.Task[Optional[str]]] = {}
 
     async def __aenter__(self) -> "QuoteScraper":
-        self._session = aiohttp.ClientSession(headers=self._headers, timeout=self._timeout)
+        self._load_author_cache()
+        connector = aiohttp.TCPConnector(
+            limit=Config.MAX_CONCURRENT_REQUESTS,
+            limit_per_host=Config.MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        self._session = aiohttp.ClientSession(
+            headers=self._headers,
+            timeout=self._timeout,
+            connector=connector,
+        )
+        # Start fetching page 1 right away so its cold DNS/TLS round-trip
+        # overlaps with whatever the caller does before scraping.
+        first_page_url = self.page_url(1)
+        self._prefetched[first_page_url] = asyncio.create_task(self.fetch_html(first_page_url))
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
+        for task in self._prefetched.values():
+            task.cancel()
+        await asyncio.gather(*self._prefetched.values(), return_exceptions=True)
+        self._prefetched.clear()
+
         if self._session is not None:
             await self._session.close()
             self._session = None
+        self._save_author_cache()
+
+    def _load_author_cache(self, path: Optional[str] = None) -> None:
+        """Seed the author cache with profiles persisted by a previous run."""
+        cache_path = path or Config.AUTHOR_CACHE_PATH
+        if not cache_path or not os.path.exists(cache_path):
+            return
+
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                persisted: Dict[str, Dict[str, Optional[str]]] = json.load(f)
+            if not isinstance(persisted, dict) or not all(
+                isinstance(info, dict) and info.keys() == AUTHOR_INFO_KEYS for info in persisted.values()
+            ):
+                raise ValueError("expected an object mapping author URLs to author_* fields")
+        except (OSError, ValueError) as exc:
+            self._logger.warning("Ignoring unreadable author cache %s: %s", cache_path, exc)
+            return
+
+        loop = asyncio.get_running_loop()
+        for author_url, info in persisted.items():
+            if author_url in self._author_cache:
+                continue
+            future: asyncio.Future[Dict[str, Optional[str]]] = loop.create_future()
+            future.set_result(info)
+            self._author_cache[author_url] = future
+
+        self._logger.info("Loaded %d cached authors from %s", len(persisted), cache_path)
+
+    def _save_author_cache(self, path: Optional[str] = None) -> None:
+        """Persist successfully fetched author profiles for the next run."""
+        cache_path = path or Config.AUTHOR_CACHE_PATH
+        if not cache_path:
+            return
+
+        persisted: Dict[str, Dict[str, Optional[str]]] = {}
+        for author_url, future in self._author_cache.items():
+            if not future.done() or future.cancelled() or future.exception() is not None:
+                continue
+            info = future.result()
+            # Skip profiles whose page could not be fetched so they are retried.
+            if info.get("author_full_name") is None:
+                continue
+            persisted[author_url] = info
+
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(persisted, f, ensure_ascii=False, indent=2)
+        except OSError as exc:
+            self._logger.warning("Could not write author cache %s: %s", cache_path, exc)
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -59,17 +274,38 @@ class QuoteScraper:
             raise RuntimeError("Session not initialized. Use 'async with QuoteScraper(...) as s:'")
         return self._session
 
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """Exponential backoff (1s, 2s, 4s, capped at 8s) plus a little jitter."""
+        return min(2 ** (attempt - 1), MAX_RETRY_DELAY_SECONDS) + random.uniform(0, 0.25)
+
     async def fetch_html(self, url: str, *, max_retries: int = 3) -> Optional[str]:
         for attempt in range(1, max_retries + 1):
             try:
-                await asyncio.sleep(Config.RATE_LIMIT_DELAY_SECONDS)
-                async with self._semaphore:
-                    async with self.session.get(url) as response:
-                        if response.status != 200:
-                            self._logger.warning("Non-200 status (%s) for %s", response.status, url)
-                            return None
-                        return await response.text()
-            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                await self._rate.acquire()
+                async with self.session.get(url) as response:
+                    if response.status == 200:
+                        # Decode with the declared charset (UTF-8 for this site)
+                        # rather than letting aiohttp sniff the encoding.
+                        body = await response.read()
+                        try:
+                            return body.decode(response.charset or "utf-8", "replace")
+                        except LookupError:
+                            return body.decode("utf-8", "replace")
+                    if response.status not in RETRYABLE_STATUSES:
+                        self._logger.warning("Non-200 status (%s) for %s", response.status, url)
+                        return None
+                    self._logger.warning(
+                        "Retryable status (%s) for %s (attempt %d/%d)",
+                        response.status,
+                        url,
+                        attempt,
+                        max_retries,
+                    )
+            except aiohttp.ClientConnectorDNSError as exc:
+                self._logger.error("DNS lookup failed for %s, not retrying: %s", url, exc)
+                return None
+            except RETRYABLE_EXCEPTIONS as exc:
                 self._logger.error(
                     "Error fetching %s (attempt %d/%d): %s",
                     url,
@@ -77,16 +313,53 @@ class QuoteScraper:
                     max_retries,
                     exc,
                 )
-                if attempt == max_retries:
-                    return None
-                await asyncio.sleep(attempt)
+            except aiohttp.ClientError as exc:
+                self._logger.error("Error fetching %s, not retrying: %s", url, exc)
+                return None
+
+            if attempt == max_retries:
+                return None
+            await asyncio.sleep(self._retry_delay(attempt))
         return None
 
-    async def get_soup(self, url: str) -> Optional[BeautifulSoup]:
-        html = await self.fetch_html(url)
+    async def get_html(self, url: str) -> Optional[str]:
+        """Like fetch_html, but reuses a response prefetched for `url` if there is one."""
+        prefetched = self._prefetched.pop(url, None)
+        if prefetched is not None:
+            return await prefetched
+        return await self.fetch_html(url)
+
+    async def get_soup(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        html = await self.get_html(url)
         if html is None:
             return None
-        return BeautifulSoup(html, "html.parser")
+        return await self.parse_html(html, parse_only=parse_only)
+
+    async def parse_html(self, html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        # Building the tree is CPU-bound; keep it off the event loop so other
+        # requests can keep receiving bytes meanwhile.
+        async with self._parse_semaphore:
+            return await asyncio.to_thread(BeautifulSoup, html, Config.HTML_PARSER, parse_only=parse_only)
+
+    def _absolute_url(self, href: str, base_url: str) -> str:
+        if href.startswith("/") and not href.startswith("//"):
+            return self._origin + href
+        return urljoin(base_url, href)
+
+    @staticmethod
+    def _extract_author_info(html: str) -> Optional[Dict[str, Optional[str]]]:
+        """Pull author fields straight out of the raw HTML; None if any is missing."""
+        full_name_match = _RE_AUTHOR_TITLE.search(html)
+        born_date_match = _RE_BORN_DATE.search(html)
+        born_location_match = _RE_BORN_LOC.search(html)
+        if not (full_name_match and born_date_match and born_location_match):
+            return None
+
+        return {
+            "author_full_name": unescape(full_name_match.group(1)).strip(),
+            "author_born_date": unescape(born_date_match.group(1)).strip(),
+            "author_born_location": unescape(born_location_match.group(1)).strip(),
+        }
 
     async def _fetch_author_info(self, author_url: str) -> Dict[str, Optional[str]]:
         default_info: Dict[str, Optional[str]] = {
@@ -95,13 +368,20 @@ class QuoteScraper:
             "author_born_location": None,
         }
 
-        soup = await self.get_soup(author_url)
-        if soup is None:
+        html = await self.fetch_html(author_url)
+        if html is None:
             return default_info
 
-        full_name_el = soup.select_one("h3.author-title")
-        born_date_el = soup.select_one("span.author-born-date")
-        born_location_el = soup.select_one("span.author-born-location")
+        # Author pages have a fixed shape, so regexes avoid building a tree;
+        # fall back to BeautifulSoup if the markup ever deviates.
+        info = self._extract_author_info(html)
+        if info is not None:
+            return info
+
+        soup = await self.parse_html(html)
+        full_name_el = SEL_TITLE.select_one(soup)
+        born_date_el = SEL_BORN_DATE.select_one(soup)
+        born_location_el = SEL_BORN_LOC.select_one(soup)
 
         return {
             "author_full_name": full_name_el.get_text(strip=True) if full_name_el else None,
@@ -117,116 +397,282 @@ class QuoteScraper:
                 "author_born_location": None,
             }
 
-        async with self._author_cache_lock:
-            cached = self._author_cache.get(author_url)
-            if cached is not None:
-                return cached
+        cached = self._author_cache.get(author_url)
+        if cached is not None and cached.cancelled():
+            # The fetch that owned this entry was cancelled; start a fresh one.
+            del self._author_cache[author_url]
+            cached = None
+        if cached is not None:
+            # Shield the shared future so cancelling one waiter leaves it intact
+            # for the owner and every other waiter.
+            return await asyncio.shield(cached)
 
-            inflight = self._author_inflight.get(author_url)
-            if inflight is None:
-                inflight = asyncio.create_task(self._fetch_author_info(author_url))
-                self._author_inflight[author_url] = inflight
+        future: asyncio.Future[Dict[str, Optional[str]]] = asyncio.get_running_loop().create_future()
+        self._author_cache[author_url] = future
 
         try:
-            info = await inflight
-        finally:
-            async with self._author_cache_lock:
-                self._author_inflight.pop(author_url, None)
-
-        async with self._author_cache_lock:
-            self._author_cache.setdefault(author_url, info)
-
+            info = await self._fetch_author_info(author_url)
+        except asyncio.CancelledError:
+            self._evict_author(author_url, future)
+            future.cancel()
+            raise
+        except Exception as exc:
+            self._evict_author(author_url, future)
+            if not future.done():
+                future.set_exception(exc)
+                # Mark the exception retrieved even when nobody else is waiting.
+                future.exception()
+            raise
+
+        if not future.done():
+            future.set_result(info)
         return info
 
-    async def scrape_quotes_page(self, page_url: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-        soup = await self.get_soup(page_url)
-        if soup is None:
-            return [], None
+    def _evict_author(self, author_url: str, future: asyncio.Future) -> None:
+        if self._author_cache.get(author_url) is future:
+            del self._author_cache[author_url]
+
+    @staticmethod
+    def _extract_quote_page(html: str) -> Optional[Tuple[List[RawQuote], Optional[str]]]:
+        """
+        Pull every quote block and the next-page href straight out of the raw
+        HTML, without building a tree. Returns None when no block is found or
+        any block doesn't have the expected shape, so the caller can fall back
+        to BeautifulSoup.
+        """
+        starts = [m.start() for m in _RE_QUOTE_START.finditer(html)]
+        # A quote div written differently (extra classes, other attribute
+        # order) would silently merge into the previous block's slice.
+        if not starts or len(starts) != len(_RE_QUOTE_CLASS.findall(html)):
+            return None
 
-        quotes: List[Dict[str, Any]] = []
-        author_urls: List[Optional[str]] = []
+        raw_quotes: List[RawQuote] = []
+        for start, end in zip(starts, starts[1:] + [len(html)]):
+            block = html[start:end]
+            tags_match = _RE_QUOTE_TAGS.search(block)
+            if tags_match is None:
+                return None
+
+            # Text, author and link all precede the block's tag list.
+            head = block[: tags_match.start()]
+            text_match = _RE_QUOTE_TEXT.search(head)
+            author_match = _RE_QUOTE_AUTHOR.search(head)
+            if text_match is None or author_match is None:
+                return None
+
+            href_match = _RE_QUOTE_AUTHOR_HREF.search(head)
+            raw_quotes.append(
+                (
+                    unescape(text_match.group(1)).strip(),
+                    unescape(author_match.group(1)).strip(),
+                    [unescape(t).strip() for t in _RE_QUOTE_TAG.findall(tags_match.group(1))],
+                    unescape(href_match.group(1)) if href_match else None,
+                )
+            )
 
-        for quote_block in soup.select("div.quote"):
-            quote_text_el = quote_block.select_one("span.text")
-            author_name_el = quote_block.select_one("small.author")
+        next_match = _RE_NEXT_HREF.search(html)
+        return raw_quotes, unescape(next_match.group(1)) if next_match else None
+
+    @staticmethod
+    def _extract_quote_page_soup(soup: BeautifulSoup) -> Tuple[List[RawQuote], Optional[str]]:
+        raw_quotes: List[RawQuote] = []
+
+        for quote_block in SEL_QUOTE.select(soup):
+            quote_text_el = author_name_el = author_link_el = None
+            tag_els = []
+            # Matches come back in document order; keep the first of each kind.
+            for el in SEL_QUOTE_FIELDS.select(quote_block):
+                classes = el.get("class") or ()
+                if el.name == "a":
+                    if "tag" in classes:
+                        tag_els.append(el)
+                    elif author_link_el is None:
+                        author_link_el = el
+                elif el.name == "span":
+                    if quote_text_el is None:
+                        quote_text_el = el
+                elif author_name_el is None:
+                    author_name_el = el
 
             if not quote_text_el or not author_name_el:
                 continue
 
-            quote_text = quote_text_el.get_text(strip=True)
-            author_name = author_name_el.get_text(strip=True)
-            tags = [t.get_text(strip=True) for t in quote_block.select("div.tags a.tag")]
-
-            author_link_el = quote_block.select_one("span a[href^='/author/']")
-            author_url: Optional[str] = None
-            if author_link_el and author_link_el.get("href"):
-                author_url = urljoin(Config.BASE_URL, author_link_el["href"])
-
-            quotes.append(
-                {
-                    "quote_text": quote_text,
-                    "author_name": author_name,
-                    "tags": tags,
-                    "author_full_name": None,
-                    "author_born_date": None,
-                    "author_born_location": None,
-                }
+            raw_quotes.append(
+                (
+                    quote_text_el.get_text(strip=True),
+                    author_name_el.get_text(strip=True),
+                    [t.get_text(strip=True) for t in tag_els],
+                    author_link_el.get("href") if author_link_el is not None else None,
+                )
             )
-            author_urls.append(author_url)
 
-        author_infos = await asyncio.gather(*(self.get_author_info(u) for u in author_urls))
-        for quote, info in zip(quotes, author_infos):
-            quote.update(info)
+        next_link = SEL_NEXT.select_one(soup)
+        return raw_quotes, next_link.get("href") if next_link else None
 
-        next_link = soup.select_one("li.next a")
-        if next_link and next_link.get("href"):
-            next_page_url = urljoin(page_url, next_link["href"])
-        else:
-            next_page_url = None
+    async def scrape_quotes_page(self, page_url: str) -> Tuple[Optional[List[Quote]], Optional[str]]:
+        """
+        Return the page's quotes and next-page URL. Quotes are None when the page
+        could not be fetched, as opposed to [] for a page without quote blocks.
+        """
+        html = await self.get_html(page_url)
+        if html is None:
+            return None, None
 
-        return quotes, next_page_url
+        extracted = self._extract_quote_page(html)
+        if extracted is None:
+            soup = await self.parse_html(html, parse_only=PAGE_STRAINER)
+            extracted = self._extract_quote_page_soup(soup)
+        raw_quotes, next_href = extracted
 
-    async def scrape_all_quotes(self) -> List[Dict[str, Any]]:
-        quotes: List[Dict[str, Any]] = []
-        next_page_url: Optional[str] = Config.BASE_URL
+        author_urls: List[Optional[str]] = []
+        for _quote_text, _author_name, _tags, author_href in raw_quotes:
+            author_urls.append(self._absolute_url(author_href, Config.BASE_URL) if author_href else None)
+
+        # Gather over unique author URLs only, then fan the results back out.
+        unique_author_urls = list(dict.fromkeys(u for u in author_urls if u))
+        author_infos = await asyncio.gather(*(self.get_author_info(u) for u in unique_author_urls))
+        infos_by_url = dict(zip(unique_author_urls, author_infos))
+        quotes = [
+            Quote(quote_text, author_name, tags, **infos_by_url.get(author_url, {}))
+            for (quote_text, author_name, tags, _author_href), author_url in zip(raw_quotes, author_urls)
+        ]
 
-        while next_page_url:
-            self._logger.info("Scraping page: %s", next_page_url)
-            page_quotes, next_page_url = await self.scrape_quotes_page(next_page_url)
-            quotes.extend(page_quotes)
-            self._logger.info("Scraped %d quotes so far", len(quotes))
+        next_page_url = self._absolute_url(next_href, page_url) if next_href else None
+        return quotes, next_page_url
 
+    @staticmethod
+    def page_url(page_number: int) -> str:
+        return urljoin(Config.BASE_URL, f"page/{page_number}/")
+
+    async def iter_quotes(
+        self,
+        start: int = 1,
+        batch: int = Config.MAX_CONCURRENT_REQUESTS,
+    ) -> AsyncIterator[Quote]:
+        """
+        Speculatively fetch `page/N/` URLs in batches of `batch` pages at a time
+        and yield their quotes in page order as each batch completes.
+
+        Pages are independent once their URL is known, so each batch is gathered
+        concurrently (still bounded by the connector's connection limit). The
+        first page that fetches successfully but has no quote blocks marks the
+        end of pagination; later pages in that batch are discarded. Pages whose
+        fetch failed are logged and skipped, and a batch in which every fetch
+        failed stops the scrape.
+        """
+        page_number = start
+        count = 0
+
+        while True:
+            page_urls = [self.page_url(i) for i in range(page_number, page_number + batch)]
+            self._logger.info("Scraping pages %d-%d", page_number, page_number + batch - 1)
+            results = await asyncio.gather(*(self.scrape_quotes_page(u) for u in page_urls))
+
+            if all(page_quotes is None for page_quotes, _next_page_url in results):
+                self._logger.error("Every page in %d-%d failed; stopping", page_number, page_number + batch - 1)
+                return
+
+            for page_url, (page_quotes, _next_page_url) in zip(page_urls, results):
+                if page_quotes is None:
+                    self._logger.warning("Skipping page %s: fetch failed", page_url)
+                    continue
+                if not page_quotes:
+                    return
+                for quote in page_quotes:
+                    yield quote
+                count += len(page_quotes)
+
+            self._logger.info("Scraped %d quotes so far", count)
+            page_number += batch
+
+    async def scrape_pages_concurrent(
+        self,
+        start: int = 1,
+        batch: int = Config.MAX_CONCURRENT_REQUESTS,
+    ) -> List[Quote]:
+        return [quote async for quote in self.iter_quotes(start=start, batch=batch)]
+
+    async def scrape_all_quotes(self) -> List[Quote]:
+        quotes = await self.scrape_pages_concurrent()
+        self._logger.info("Scraped %d quotes in total", len(quotes))
         return quotes
 
-    def save_as_csv(self, quotes: List[Dict[str, Any]], path: Optional[str] = None) -> None:
-        output_path = path or Config.OUTPUT_CSV
+    async def scrape_and_save(
+        self,
+        csv_path: Optional[str] = None,
+        json_path: Optional[str] = None,
+    ) -> int:
+        """
+        Stream quotes to CSV and JSON as pages complete instead of collecting
+        them all first. Produces the same files as save_as_csv/save_as_json.
+
+        Rows go to `<path>.tmp` files that replace the real outputs only once
+        the scrape finishes, so a failed run leaves the previous files intact.
+        """
+        csv_output = csv_path or Config.OUTPUT_CSV
+        json_output = json_path or Config.OUTPUT_JSON
+        csv_tmp = csv_output + ".tmp"
+        json_tmp = json_output + ".tmp"
+        count = 0
 
-        fieldnames = [
-            "quote_text",
-            "author_name",
-            "tags",
-            "author_full_name",
-            "author_born_date",
-            "author_born_location",
-        ]
+        try:
+            with (
+                open(csv_tmp, "w", newline="", encoding="utf-8-sig") as csv_file,
+                open(json_tmp, "wb") as json_file,
+            ):
+                writer = csv.writer(csv_file)
+                writer.writerow(CSV_FIELDNAMES)
+                json_file.write(b"[")
+
+                async for quote in self.iter_quotes():
+                    writer.writerow(self._csv_row(quote))
+                    # Indent each element by one level to match a whole-list dump.
+                    json_file.write(b"\n  " if count == 0 else b",\n  ")
+                    json_file.write(self._encode_json(quote).replace(b"\n", b"\n  "))
+                    count += 1
+
+                json_file.write(b"\n]" if count else b"]")
+        except BaseException:
+            for tmp_path in (csv_tmp, json_tmp):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            raise
+
+        os.replace(csv_tmp, csv_output)
+        os.replace(json_tmp, json_output)
+
+        self._logger.info("Scraped %d quotes in total", count)
+        return count
+
+    @staticmethod
+    def _csv_row(quote: Quote) -> Tuple[Optional[str], ...]:
+        return (
+            quote.quote_text,
+            quote.author_name,
+            ", ".join(quote.tags),
+            quote.author_full_name,
+            quote.author_born_date,
+            quote.author_born_location,
+        )
+
+    @staticmethod
+    def _encode_json(value: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        return json.dumps(value, ensure_ascii=False, indent=2, default=asdict).encode("utf-8")
+
+    def save_as_csv(self, quotes: Iterable[Quote], path: Optional[str] = None) -> None:
+        output_path = path or Config.OUTPUT_CSV
 
         with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for quote in quotes:
-                row = dict(quote)
-                tags_value = quote.get("tags", [])
-                if isinstance(tags_value, list):
-                    row["tags"] = ", ".join(tags_value)
-                else:
-                    row["tags"] = str(tags_value)
-                writer.writerow(row)
-
-    def save_as_json(self, quotes: List[Dict[str, Any]], path: Optional[str] = None) -> None:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(self._csv_row(quote) for quote in quotes)
+
+    def save_as_json(self, quotes: List[Quote], path: Optional[str] = None) -> None:
         output_path = path or Config.OUTPUT_JSON
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(quotes, f, ensure_ascii=False, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(self._encode_json(quotes))
 
 
 def main() -> None:
@@ -241,12 +687,13 @@ def main() -> None:
 
     async def _run_and_save() -> int:
         async with QuoteScraper() as scraper:
-            quotes = await scraper.scrape_all_quotes()
-            scraper.save_as_csv(quotes)
-            scraper.save_as_json(quotes)
-            return len(quotes)
+            return await scraper.scrape_and_save()
 
-    count = asyncio.run(_run_and_save())
+    # uvloop's libuv-based loop cuts per-request overhead; it has no Windows support.
+    if uvloop is not None and sys.platform != "win32":
+        count = uvloop.run(_run_and_save())
+    else:
+        count = asyncio.run(_run_and_save())
     duration = time.perf_counter() - start_time
 
     logger.info("Scraped %d quotes in %.2f seconds", count, duration)
@@ -1,9 +1,17 @@
 import asyncio
+import csv
+import json
+import time
+from dataclasses import asdict, fields
+from urllib.parse import urljoin
 
+import pytest
+from aiohttp import web
 from bs4 import BeautifulSoup
 
+import scrape_quotes
 from config import Config
-from scrape_quotes import QuoteScraper
+from scrape_quotes import Quote, QuoteScraper, TokenBucket
 
 
 def test_config_defaults_are_valid():
@@ -14,7 +22,7 @@ def test_config_defaults_are_valid():
 class DummyScraper(QuoteScraper):
     """
     QuoteScraper subclass that bypasses network calls for testing by
-    returning fixed HTML for page and author URLs.
+    returning fixed HTML for page and author URLs; parsing runs as usual.
     """
 
     PAGE_HTML = """
@@ -37,10 +45,10 @@ class DummyScraper(QuoteScraper):
     <span class="author-born-location">in Test City, Test Country</span>
     """
 
-    async def get_soup(self, url: str):
+    async def fetch_html(self, url: str, *, max_retries: int = 3):
         if "author" in url:
-            return BeautifulSoup(self.AUTHOR_HTML, "html.parser")
-        return BeautifulSoup(self.PAGE_HTML, "html.parser")
+            return self.AUTHOR_HTML
+        return self.PAGE_HTML
 
 
 def test_scrape_quotes_page_parses_quote_and_author():
@@ -52,12 +60,540 @@ def test_scrape_quotes_page_parses_quote_and_author():
         assert len(quotes) == 1
 
         quote = quotes[0]
-        assert quote["quote_text"] == "“Test quote.”"
-        assert quote["author_name"] == "Test Author"
-        assert quote["tags"] == ["tag1", "tag2"]
-        assert quote["author_full_name"] == "Test Author"
-        assert quote["author_born_date"] == "January 1, 1900"
-        assert quote["author_born_location"] == "in Test City, Test Country"
+        assert quote.quote_text == "“Test quote.”"
+        assert quote.author_name == "Test Author"
+        assert quote.tags == ["tag1", "tag2"]
+        assert quote.author_full_name == "Test Author"
+        assert quote.author_born_date == "January 1, 1900"
+        assert quote.author_born_location == "in Test City, Test Country"
 
     asyncio.run(run())
 
+
+class PagedDummyScraper(DummyScraper):
+    """
+    DummyScraper variant that serves quote pages up to `LAST_PAGE` and an
+    empty page afterwards, to exercise speculative pagination.
+    """
+
+    LAST_PAGE = 3
+
+    async def fetch_html(self, url: str, *, max_retries: int = 3):
+        if "page/" in url:
+            page_number = int(url.rstrip("/").rsplit("/", 1)[-1])
+            if page_number > self.LAST_PAGE:
+                return "<html></html>"
+        return await super().fetch_html(url, max_retries=max_retries)
+
+
+def test_scrape_pages_concurrent_stops_at_first_empty_page():
+    async def run():
+        scraper = PagedDummyScraper()
+        quotes = await scraper.scrape_pages_concurrent(batch=2)
+
+        assert len(quotes) == PagedDummyScraper.LAST_PAGE
+        assert all(q.author_full_name == "Test Author" for q in quotes)
+
+    asyncio.run(run())
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    async def run():
+        bucket = TokenBucket(rate=20.0, capacity=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst = time.monotonic() - start
+
+        await bucket.acquire()
+        throttled = time.monotonic() - start
+
+        assert burst < 0.02
+        assert throttled >= 0.04
+
+    asyncio.run(run())
+
+
+def test_scrape_pages_concurrent_skips_failed_page_mid_batch():
+    class FailingPageScraper(PagedDummyScraper):
+        LAST_PAGE = 5
+
+        async def fetch_html(self, url: str, *, max_retries: int = 3):
+            if url == QuoteScraper.page_url(2):
+                return None
+            return await super().fetch_html(url, max_retries=max_retries)
+
+    async def run():
+        scraper = FailingPageScraper()
+        quotes, _ = await scraper.scrape_quotes_page(QuoteScraper.page_url(2))
+        assert quotes is None
+
+        return await scraper.scrape_pages_concurrent(batch=3)
+
+    assert len(asyncio.run(run())) == FailingPageScraper.LAST_PAGE - 1
+
+
+def test_scrape_pages_concurrent_stops_when_whole_batch_fails():
+    class DownScraper(DummyScraper):
+        async def fetch_html(self, url: str, *, max_retries: int = 3):
+            return None
+
+    assert asyncio.run(DownScraper().scrape_pages_concurrent(batch=2)) == []
+
+
+class CountingScraper(DummyScraper):
+    """DummyScraper that counts author profile fetches."""
+
+    def __init__(self):
+        super().__init__()
+        self.author_fetches = 0
+
+    async def _fetch_author_info(self, author_url: str):
+        self.author_fetches += 1
+        await asyncio.sleep(0)
+        return await super()._fetch_author_info(author_url)
+
+
+def test_get_author_info_fetches_each_author_once():
+    async def run():
+        scraper = CountingScraper()
+        url = "https://example.com/author/test-author"
+
+        infos = await asyncio.gather(*(scraper.get_author_info(url) for _ in range(5)))
+
+        assert scraper.author_fetches == 1
+        assert all(info["author_full_name"] == "Test Author" for info in infos)
+
+    asyncio.run(run())
+
+
+def test_save_as_json_output_matches_with_and_without_orjson(tmp_path, monkeypatch):
+    quotes = [
+        Quote(
+            quote_text="“Test quote.”",
+            author_name="André Gide",
+            tags=["tag1", "tag2"],
+            author_full_name="André Gide",
+        )
+    ]
+    scraper = QuoteScraper()
+
+    fast_path = tmp_path / "fast.json"
+    scraper.save_as_json(quotes, str(fast_path))
+
+    monkeypatch.setattr(scrape_quotes, "orjson", None)
+    stdlib_path = tmp_path / "stdlib.json"
+    scraper.save_as_json(quotes, str(stdlib_path))
+
+    assert fast_path.read_bytes() == stdlib_path.read_bytes()
+    assert json.loads(fast_path.read_text(encoding="utf-8")) == [asdict(q) for q in quotes]
+
+
+def test_save_as_csv_joins_tags_and_keeps_column_order(tmp_path):
+    quotes = [
+        Quote(
+            quote_text="“Test quote.”",
+            author_name="Test Author",
+            tags=["tag1", "tag2"],
+            author_full_name="Test Author",
+            author_born_date="January 1, 1900",
+        )
+    ]
+    path = tmp_path / "quotes.csv"
+    QuoteScraper().save_as_csv(quotes, str(path))
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+
+    assert list(rows[0]) == [f.name for f in fields(Quote)]
+    assert rows[0]["tags"] == "tag1, tag2"
+    assert rows[0]["author_born_location"] == ""
+
+
+def test_author_cache_persists_across_runs(tmp_path, monkeypatch):
+    cache_path = tmp_path / "authors.json"
+    monkeypatch.setattr(Config, "AUTHOR_CACHE_PATH", str(cache_path))
+    url = "https://example.com/author/test-author"
+
+    async def run_once() -> int:
+        async with CountingScraper() as scraper:
+            info = await scraper.get_author_info(url)
+            assert info["author_born_date"] == "January 1, 1900"
+            return scraper.author_fetches
+
+    assert asyncio.run(run_once()) == 1
+    assert url in json.loads(cache_path.read_text(encoding="utf-8"))
+    assert asyncio.run(run_once()) == 0
+
+
+def test_malformed_author_cache_is_ignored(tmp_path, monkeypatch):
+    cache_path = tmp_path / "authors.json"
+    monkeypatch.setattr(Config, "AUTHOR_CACHE_PATH", str(cache_path))
+    url = "https://example.com/author/test-author"
+
+    async def run_once() -> int:
+        async with CountingScraper() as scraper:
+            await scraper.get_author_info(url)
+            return scraper.author_fetches
+
+    for contents in (
+        "[1, 2]",
+        json.dumps({url: ["not", "a", "dict"]}),
+        json.dumps({url: {"author_full_name": "Test Author", "unexpected": "x"}}),
+    ):
+        cache_path.write_text(contents, encoding="utf-8")
+        assert asyncio.run(run_once()) == 1
+
+
+def test_retry_delay_is_exponential_with_capped_jitter():
+    for attempt, base in [(1, 1), (2, 2), (3, 4), (4, 8), (6, 8)]:
+        delay = QuoteScraper._retry_delay(attempt)
+        assert base <= delay <= base + 0.25
+
+
+def test_scrape_and_save_streams_same_output_as_batch_save(tmp_path):
+    async def run():
+        scraper = PagedDummyScraper()
+        count = await scraper.scrape_and_save(
+            csv_path=str(tmp_path / "streamed.csv"),
+            json_path=str(tmp_path / "streamed.json"),
+        )
+        quotes = await scraper.scrape_all_quotes()
+        scraper.save_as_csv(quotes, str(tmp_path / "batch.csv"))
+        scraper.save_as_json(quotes, str(tmp_path / "batch.json"))
+        return count
+
+    assert asyncio.run(run()) == PagedDummyScraper.LAST_PAGE
+    for name in ("csv", "json"):
+        streamed = (tmp_path / f"streamed.{name}").read_bytes()
+        assert streamed == (tmp_path / f"batch.{name}").read_bytes()
+
+
+def test_author_url_comes_from_page_link_only():
+    class NoLinkScraper(CountingScraper):
+        PAGE_HTML = DummyScraper.PAGE_HTML.replace('<a href="/author/test-author">about</a>', "")
+
+    async def run(scraper_cls):
+        scraper = scraper_cls()
+        quotes, _ = await scraper.scrape_quotes_page("https://example.com/page/1")
+        return [q.author_full_name for q in quotes], list(scraper._author_cache)
+
+    author_base = Config.BASE_URL.rstrip("/") + "/author/"
+    assert asyncio.run(run(CountingScraper)) == (["Test Author"], [author_base + "test-author"])
+    assert asyncio.run(run(NoLinkScraper)) == ([None], [])
+
+
+def test_author_info_falls_back_to_soup_when_regex_misses():
+    class OddMarkupScraper(DummyScraper):
+        AUTHOR_HTML = """
+        <h3 class="author-title" id="name">Test &amp; Author</h3>
+        <span class="author-born-date">January 1, 1900</span>
+        <span class="author-born-location">in Test City, Test Country</span>
+        """
+
+    assert QuoteScraper._extract_author_info(OddMarkupScraper.AUTHOR_HTML) is None
+    assert QuoteScraper._extract_author_info(DummyScraper.AUTHOR_HTML) == {
+        "author_full_name": "Test Author",
+        "author_born_date": "January 1, 1900",
+        "author_born_location": "in Test City, Test Country",
+    }
+
+    info = asyncio.run(OddMarkupScraper()._fetch_author_info("https://example.com/author/x"))
+    assert info["author_full_name"] == "Test & Author"
+    assert info["author_born_location"] == "in Test City, Test Country"
+
+
+def test_fetch_html_decodes_declared_charset_and_retries_only_transient_statuses(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "AUTHOR_CACHE_PATH", str(tmp_path / "authors.json"))
+    monkeypatch.setattr(QuoteScraper, "_retry_delay", staticmethod(lambda attempt: 0))
+    requests_seen = []
+
+    async def handler(request):
+        requests_seen.append(request.path)
+        if request.path == "/latin1":
+            return web.Response(body="Gödel".encode("latin-1"), content_type="text/html", charset="latin-1")
+        if request.path == "/utf8":
+            return web.Response(text="“Test quote.”", content_type="text/html")
+        if request.path == "/flaky" and requests_seen.count("/flaky") == 1:
+            return web.Response(status=503)
+        if request.path == "/flaky":
+            return web.Response(text="recovered", content_type="text/html")
+        if request.path == "/unavailable":
+            return web.Response(status=503)
+        return web.Response(status=404)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/{name}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        base = f"http://127.0.0.1:{port}"
+        monkeypatch.setattr(Config, "BASE_URL", base + "/")
+
+        try:
+            async with QuoteScraper() as scraper:
+                assert await scraper.fetch_html(f"{base}/latin1") == "Gödel"
+                assert await scraper.fetch_html(f"{base}/utf8") == "“Test quote.”"
+                assert await scraper.fetch_html(f"{base}/missing") is None
+                assert await scraper.fetch_html(f"{base}/flaky") == "recovered"
+                assert await scraper.fetch_html(f"{base}/unavailable", max_retries=3) is None
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(run())
+    assert requests_seen.count("/missing") == 1
+    assert requests_seen.count("/flaky") == 2
+    assert requests_seen.count("/unavailable") == 3
+
+
+def test_first_page_is_prefetched_on_enter_and_reused(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "AUTHOR_CACHE_PATH", str(tmp_path / "authors.json"))
+
+    class RecordingScraper(PagedDummyScraper):
+        def __init__(self):
+            super().__init__()
+            self.fetched_urls = []
+
+        async def fetch_html(self, url: str, *, max_retries: int = 3):
+            self.fetched_urls.append(url)
+            return await super().fetch_html(url, max_retries=max_retries)
+
+    async def run():
+        async with RecordingScraper() as scraper:
+            assert scraper.fetched_urls == []
+            await asyncio.sleep(0)
+            assert scraper.fetched_urls == [QuoteScraper.page_url(1)]
+
+            quotes = await scraper.scrape_all_quotes()
+            assert len(quotes) == RecordingScraper.LAST_PAGE
+            assert scraper.fetched_urls.count(QuoteScraper.page_url(1)) == 1
+            assert scraper._prefetched == {}
+
+    asyncio.run(run())
+
+
+SITE_PAGE_HTML = """
+<div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
+    <span class="text" itemprop="text">“It is our choices, Harry, that show what we truly are.”</span>
+    <span>by <small class="author" itemprop="author">J.K. Rowling</small>
+    <a href="/author/J-K-Rowling">(about)</a>
+    </span>
+    <div class="tags">
+        Tags:
+        <meta class="keywords" itemprop="keywords" content="abilities,choices" />
+        <a class="tag" href="/tag/abilities/page/1/">abilities</a>
+        <a class="tag" href="/tag/choices/page/1/">choices</a>
+    </div>
+</div>
+<div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
+    <span class="text" itemprop="text">“Understanding is the first step to acceptance.”</span>
+    <span>by <small class="author" itemprop="author">J.K. Rowling</small>
+    <a href="/author/J-K-Rowling">(about)</a>
+    </span>
+    <div class="tags">
+        Tags:
+        <meta class="keywords" itemprop="keywords" content="" />
+    </div>
+</div>
+<nav>
+    <ul class="pager">
+        <li class="next">
+            <a href="/page/2/">Next <span aria-hidden="true">&rarr;</span></a>
+        </li>
+    </ul>
+</nav>
+"""
+
+
+def test_scrape_quotes_page_parses_site_markup():
+    class SitePageScraper(CountingScraper):
+        PAGE_HTML = SITE_PAGE_HTML
+
+    async def run():
+        scraper = SitePageScraper()
+        quotes, next_url = await scraper.scrape_quotes_page(QuoteScraper.page_url(1))
+        return scraper, quotes, next_url
+
+    scraper, quotes, next_url = asyncio.run(run())
+
+    assert next_url == QuoteScraper.page_url(2)
+    assert [q.tags for q in quotes] == [["abilities", "choices"], []]
+    assert quotes[1].quote_text == "“Understanding is the first step to acceptance.”"
+    assert all(q.author_name == "J.K. Rowling" for q in quotes)
+    assert list(scraper._author_cache) == [Config.BASE_URL.rstrip("/") + "/author/J-K-Rowling"]
+    assert scraper.author_fetches == 1
+
+
+def test_absolute_url_matches_urljoin(monkeypatch):
+    for base in ("https://quotes.toscrape.com/", "https://example.com/mirror/"):
+        monkeypatch.setattr(Config, "BASE_URL", base)
+        scraper = QuoteScraper()
+        page = base + "page/3/"
+        for href in ("/author/J-K-Rowling", "/page/4/", "page/4/", "//cdn.example.com/x", "https://other.example/y"):
+            assert scraper._absolute_url(href, page) == urljoin(page, href)
+
+
+def test_failed_author_fetch_is_shared_then_retried():
+    class FlakyScraper(CountingScraper):
+        async def _fetch_author_info(self, author_url: str):
+            if self.author_fetches == 0:
+                self.author_fetches += 1
+                await asyncio.sleep(0)
+                raise RuntimeError("boom")
+            return await super()._fetch_author_info(author_url)
+
+    async def run():
+        scraper = FlakyScraper()
+        url = "https://example.com/author/test-author"
+
+        results = await asyncio.gather(*(scraper.get_author_info(url) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert url not in scraper._author_cache
+
+        info = await scraper.get_author_info(url)
+        assert info["author_full_name"] == "Test Author"
+        assert scraper.author_fetches == 2
+
+    asyncio.run(run())
+
+
+SITE_SIDEBAR_HTML = """
+<div class="col-md-4 tags-box">
+    <h2>Top Ten tags</h2>
+    <span class="tag-item">
+    <a class="tag" style="font-size: 28px" href="/tag/love/">love</a>
+    </span>
+</div>
+"""
+
+
+# Site markup with extra classes on the quote and pager elements, and a quote
+# div whose class attribute isn't first.
+VARIANT_PAGE_HTML = (
+    SITE_PAGE_HTML.replace('<div class="quote" itemscope', '<div class="quote featured" itemscope', 1)
+    .replace('<li class="next">', '<li class="next active">')
+    + SITE_PAGE_HTML.split("<nav>")[0].replace(
+        '<div class="quote" itemscope itemtype="http://schema.org/CreativeWork">',
+        '<div itemscope itemtype="http://schema.org/CreativeWork" class="quote">',
+    )
+)
+
+
+def test_quote_page_regex_extraction_matches_soup():
+    for html in (SITE_PAGE_HTML + SITE_SIDEBAR_HTML, DummyScraper.PAGE_HTML):
+        soup = BeautifulSoup(html, Config.HTML_PARSER, parse_only=scrape_quotes.PAGE_STRAINER)
+        extracted = QuoteScraper._extract_quote_page(html)
+
+        assert extracted is not None
+        assert extracted == QuoteScraper._extract_quote_page_soup(soup)
+
+
+def test_page_strainer_keeps_blocks_with_extra_classes_and_attribute_order():
+    full = QuoteScraper._extract_quote_page_soup(BeautifulSoup(VARIANT_PAGE_HTML, Config.HTML_PARSER))
+    strained_soup = BeautifulSoup(VARIANT_PAGE_HTML, Config.HTML_PARSER, parse_only=scrape_quotes.PAGE_STRAINER)
+    strained = QuoteScraper._extract_quote_page_soup(strained_soup)
+
+    assert len(full[0]) == 4
+    assert full[1] == "/page/2/"
+    assert strained == full
+
+
+def test_quote_page_regex_defers_to_soup_for_unrecognised_blocks():
+    class VariantPageScraper(CountingScraper):
+        PAGE_HTML = VARIANT_PAGE_HTML
+
+    assert QuoteScraper._extract_quote_page(VARIANT_PAGE_HTML) is None
+    assert QuoteScraper._extract_quote_page(SITE_PAGE_HTML + '<span class="quote">x</span>') is None
+
+    quotes, next_url = asyncio.run(VariantPageScraper().scrape_quotes_page(QuoteScraper.page_url(1)))
+    assert len(quotes) == 4
+    assert next_url == QuoteScraper.page_url(2)
+
+
+def test_quote_page_falls_back_to_soup_when_regex_misses():
+    class OddMarkupScraper(DummyScraper):
+        PAGE_HTML = DummyScraper.PAGE_HTML.replace('<span class="text">', '<span class="text featured">')
+
+    assert QuoteScraper._extract_quote_page(OddMarkupScraper.PAGE_HTML) is None
+    assert QuoteScraper._extract_quote_page("<html></html>") is None
+
+    quotes, _ = asyncio.run(OddMarkupScraper().scrape_quotes_page("https://example.com/page/1"))
+    assert [q.quote_text for q in quotes] == ["“Test quote.”"]
+    assert quotes[0].author_full_name == "Test Author"
+
+
+def test_scrape_and_save_keeps_previous_outputs_when_scrape_fails(tmp_path):
+    class BrokenScraper(PagedDummyScraper):
+        async def fetch_html(self, url: str, *, max_retries: int = 3):
+            if url == QuoteScraper.page_url(3):
+                raise RuntimeError("boom")
+            return await super().fetch_html(url, max_retries=max_retries)
+
+    csv_path = tmp_path / "quotes.csv"
+    json_path = tmp_path / "quotes.json"
+    csv_path.write_text("previous csv", encoding="utf-8")
+    json_path.write_text("previous json", encoding="utf-8")
+
+    async def run():
+        await BrokenScraper().scrape_and_save(csv_path=str(csv_path), json_path=str(json_path))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+    assert csv_path.read_text(encoding="utf-8") == "previous csv"
+    assert json_path.read_text(encoding="utf-8") == "previous json"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["quotes.csv", "quotes.json"]
+
+
+def test_cancelled_author_waiter_does_not_break_shared_fetch():
+    class GatedScraper(CountingScraper):
+        def __init__(self):
+            super().__init__()
+            self.release = asyncio.Event()
+
+        async def _fetch_author_info(self, author_url: str):
+            await self.release.wait()
+            return await super()._fetch_author_info(author_url)
+
+    async def run():
+        scraper = GatedScraper()
+        url = "https://example.com/author/test-author"
+
+        owner = asyncio.create_task(scraper.get_author_info(url))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(scraper.get_author_info(url))
+        other = asyncio.create_task(scraper.get_author_info(url))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+        scraper.release.set()
+
+        assert (await owner)["author_full_name"] == "Test Author"
+        assert (await other)["author_full_name"] == "Test Author"
+        assert waiter.cancelled()
+        assert (await scraper.get_author_info(url))["author_full_name"] == "Test Author"
+        assert scraper.author_fetches == 1
+
+    asyncio.run(run())
+
+
+def test_author_is_refetched_after_owner_cancelled():
+    async def run():
+        scraper = CountingScraper()
+        url = "https://example.com/author/test-author"
+
+        owner = asyncio.create_task(scraper.get_author_info(url))
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+
+        assert url not in scraper._author_cache
+        assert (await scraper.get_author_info(url))["author_full_name"] == "Test Author"
+
+    asyncio.run(run())